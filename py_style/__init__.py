@@ -103,10 +103,10 @@ def run_progress_bar(values: int, *, delay: float = 1, symbol: str = "-") -> Non
         Args: 
             values: int,
             delay: float = 1,
-            style: str = "default"
+            symbol: str = "-"
             
         Returns: NoReturn
         """
         
-        progress_bar = ProgressBar(values)
-        progress_bar.run(del_self=True)
+        with ProgressBar(values, delay=delay, symbol=symbol) as progress_bar:
+            progress_bar.run()
@@ -3,24 +3,143 @@ Classes for Py-Style package.
 This module defines _BaseObject, Theme, Console, ProgressBar and Table.
 """
 
-from time import sleep
+import re
+import sys
+import signal
+from time import sleep, perf_counter
 from os import get_terminal_size
 from abc import ABC
-from typing import Any
+from functools import cache
+from itertools import repeat
+from typing import Any, Iterable
 from .constants import *
 
 # Set __all__
 __all__ = ["Theme", "Console", "Table", "ProgressBar", "DEFAULT_THEME"]
 
+# Precomputed escape sequence composites. _END is the shared default line
+# ending for Console.log and Console.write; Console.prompt ends with a bare
+# STOP since input() keeps the cursor on the same line.
+_END = STOP + "\n"
+_TITLE_PREFIX = BOLD + UNDERLINE
+
+# Terminal width cache. The width is refreshed on SIGWINCH where the platform
+# supports it, and every _WIDTH_REFRESH_INTERVAL lookups otherwise.
+_WIDTH_REFRESH_INTERVAL = 50
+_width_lookups = 0
+
+def _query_terminal_width() -> int:
+    """
+    Query the terminal width, falling back to 80 columns
+    when stdout is not attached to a terminal.
+    
+    Args: None
+    
+    Returns: int
+    """
+    
+    try:
+        return get_terminal_size().columns
+    except OSError:
+        return 80
+    
+_TERM_WIDTH = _query_terminal_width()
+
+def _on_resize(signum: int, frame: Any) -> None:
+    """
+    SIGWINCH handler that refreshes _TERM_WIDTH and chains
+    to any previously installed handler.
+    
+    Args:
+        signum: int,
+        frame: Any
+        
+    Returns: None
+    """
+    
+    global _TERM_WIDTH
+    _TERM_WIDTH = _query_terminal_width()
+    
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+        
+_previous_resize_handler = None
+_WATCHING_RESIZE = False
+
+if hasattr(signal, "SIGWINCH"):
+    try:
+        _previous_resize_handler = signal.signal(signal.SIGWINCH, _on_resize)
+        _WATCHING_RESIZE = True
+    except ValueError:
+        # Signal handlers can only be installed from the main thread
+        pass
+    
+def _terminal_width() -> int:
+    """
+    Return the cached terminal width, polling it periodically
+    when resize signals are not available.
+    
+    Args: None
+    
+    Returns: int
+    """
+    
+    global _TERM_WIDTH, _width_lookups
+    
+    if not _WATCHING_RESIZE:
+        _width_lookups += 1
+        if _width_lookups >= _WIDTH_REFRESH_INTERVAL:
+            _width_lookups = 0
+            _TERM_WIDTH = _query_terminal_width()
+            
+    return _TERM_WIDTH
+
+# Shared run of spaces; padding is sliced from it instead of built per line
+_SPACES = " " * 8192
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+def _visible_len(text: str) -> int:
+    """
+    Return the printed length of text, ignoring ANSI escape sequences.
+    
+    Args:
+        text: str
+        
+    Returns: int
+    """
+    
+    if "\x1b" not in text:
+        return len(text)
+    
+    return len(_ANSI_RE.sub("", text))
+
+# Alignment helpers return the (left, right) padding for a line
+# of the given length, so callers can format the line in one go.
+def _align_center(length: int, width: int) -> tuple[int, int]:
+    padding = max(0, width - length)
+    return padding // 2, padding - padding // 2
+
+def _align_right(length: int, width: int) -> tuple[int, int]:
+    return max(0, width - length), 0
+
+def _align_left(length: int, width: int) -> tuple[int, int]:
+    return 0, 0
+
+_ALIGNMENTS = {CENTER: _align_center, LEFT: _align_left, RIGHT: _align_right}
+
 class _BaseObject(ABC):
     """
     Abstract Base Class for all other classes defined here.
-    Defines the help method.
+    Defines the help method, whose output is cached per class.
     
     Args: None
     """
     
+    __slots__ = ()
+    
     @classmethod
+    @cache
     def help(cls) -> str:
         return f"""{FG_CYAN}{cls.__name__}{STOP}\n{cls.__doc__}"""
 
@@ -35,6 +154,8 @@ class Theme(_BaseObject):
         **styles
     """
     
+    __slots__ = ("__info", "__warning", "__error", "__success", "__styles", "_resolved")
+    
     def __init__(self, info: str = FG_CYAN, warning: str = FG_YELLOW, 
                  error: str = FG_RED, success: str = FG_GREEN, **styles) -> None:
         self.__info = info
@@ -45,7 +166,7 @@ class Theme(_BaseObject):
         self.__construct()
         
     def get_style(self, target: str) -> str:
-        return self.__styles[target]
+        return self._resolved[target]
         
     @property
     def info(self) -> str:
@@ -70,29 +191,32 @@ class Theme(_BaseObject):
     @info.setter
     def info(self, color: str) -> None:
         self.__info = color
-        self.__construct()
+        self.__styles["info"] = self._resolved["info"] = color
         
     @warning.setter
     def warning(self, color: str) -> None:
         self.__warning = color
-        self.__construct()
+        self.__styles["warning"] = self._resolved["warning"] = color
         
     @error.setter
     def error(self, color: str) -> None:
         self.__error = color
-        self.__construct()
+        self.__styles["error"] = self._resolved["error"] = color
         
     @success.setter
     def success(self, color: str) -> None:
         self.__success = color
+        self.__styles["success"] = self._resolved["success"] = color
         
     @styles.setter
     def styles(self, **objects) -> None:
         self.__styles.update(objects)
+        self._resolved = dict(self.__styles)
         
     def __construct(self) -> None:
         """
-        Set the info, warning, error and default keys.
+        Set the info, warning, error and default keys and build
+        the resolved style map that Console and ProgressBar read from.
         
         Args: None
         
@@ -104,6 +228,7 @@ class Theme(_BaseObject):
         self.__styles["success"] = self.__success
         self.__styles["error"] = self.__error
         self.__styles["default"] = DEFAULT
+        self._resolved = dict(self.__styles)
 
 DEFAULT_THEME = Theme(FG_CYAN, FG_YELLOW, FG_RED, FG_GREEN, bold=BOLD, dim=DIM, italic=ITALIC, underline=UNDERLINE, 
                       blink=BLINK, inverse=INVERSE, hidden=HIDDEN, strikethrough=STRIKETHROUGH, fg_black=FG_BLACK,
@@ -114,21 +239,35 @@ DEFAULT_THEME = Theme(FG_CYAN, FG_YELLOW, FG_RED, FG_GREEN, bold=BOLD, dim=DIM,
 class Console(_BaseObject):
     """
     Console object on which text can be printed and input can be taken.
+    
+    If buffered is True, output is collected in memory and written to
+    stdout in a single call once buffer_size characters are pending,
+    before prompting, or when flush() is called. Buffered consoles 
+    should call flush() before the program exits.
 
     Args:
         title: str, 
-        theme: Theme = DEFAULT_THEME
+        theme: Theme = DEFAULT_THEME,
+        print_title: bool = True,
+        buffered: bool = False,
+        buffer_size: int = 65536
     """
     
-    def __init__(self, title: str, theme: Theme = DEFAULT_THEME, print_title: bool = True) -> None:
+    __slots__ = ("__title", "__theme", "__buffer", "__buffer_size", "__pending")
+    
+    def __init__(self, title: str, theme: Theme = DEFAULT_THEME, print_title: bool = True, *, 
+                 buffered: bool = False, buffer_size: int = 65536) -> None:
         self.__title = title
         self.__theme = theme
+        self.__buffer = [] if buffered else None
+        self.__buffer_size = buffer_size
+        self.__pending = 0
         
         if print_title:
             self.print_title()
         
     def print_title(self) -> None:
-        self.write(f"{BOLD}{UNDERLINE}{self.__title}{STOP}", alignment=CENTER)
+        self.write(f"{_TITLE_PREFIX}{self.__title}{STOP}", alignment=CENTER)
         
     @property
     def theme(self) -> Theme:
@@ -156,27 +295,27 @@ class Console(_BaseObject):
         Returns: None
         """
         
-        print(CLEAR, end="")
+        self.__emit(CLEAR)
         if print_title:
             self.print_title()
         
-    def log(self, text: str, *, end: str = f"{STOP}\n", 
+    def log(self, text: str, *, end: str = _END, 
             sep: str = " ", style: str = "default", alignment: str = LEFT) -> None:
         """
         Customized log method.
         
         Args: 
             text: str, 
-            end: str = f"{STOP}\\n", 
+            end: str = _END, 
             sep: str = " ", 
             style: str = "default"
             
         Returns: None
         """
         
-        print(self.__align_text(self.__theme.get_style(style) + text, alignment), end=end, sep=sep)
+        self.__emit(self.__format_line(text, style, alignment, end))
             
-    def write(self, text: str, *, alignment: str = LEFT, end: str = f"{STOP}\n", 
+    def write(self, text: str, *, alignment: str = LEFT, end: str = _END, 
               sep: str = " ", style: str = "default") -> None:
         """
         Customized print method.
@@ -184,14 +323,32 @@ class Console(_BaseObject):
         Args:
             text: str,
             alignment: str, 
-            end: str = STOP, 
+            end: str = _END, 
             sep: str = "", 
             style: str
         
         Returns: None
         """
         
-        print(self.__align_text(self.__theme.get_style(style) + text, alignment), end=end, sep=sep)
+        self.__emit(self.__format_line(text, style, alignment, end))
+        
+    def write_many(self, lines: Iterable[str], *, alignment: str = LEFT, end: str = _END, 
+                   style: str = "default") -> None:
+        """
+        Write several lines with the same style and alignment
+        using a single write to stdout.
+        
+        Args:
+            lines: Iterable[str],
+            alignment: str = LEFT,
+            end: str = _END,
+            style: str = "default"
+            
+        Returns: None
+        """
+        
+        format_line = self.__format_line
+        self.__emit("".join(format_line(line, style, alignment, end) for line in lines))
         
     def prompt(self, text: str, *, end: str = STOP, style: str = "default") -> str:
         """
@@ -206,39 +363,97 @@ class Console(_BaseObject):
         Returns: str
         """
         
-        return input(self.__theme.get_style(style) + text + end)
+        self.flush()
+        return input(self.__theme._resolved[style] + text + end)
+    
+    def flush(self) -> None:
+        """
+        Write any buffered output to stdout and flush it.
+        
+        Args: None
+        
+        Returns: None
+        """
+        
+        if self.__buffer:
+            sys.stdout.write("".join(self.__buffer))
+            self.__buffer.clear()
+            self.__pending = 0
+            
+        sys.stdout.flush()
+        
+    def __emit(self, text: str) -> None:
+        """
+        Private method that writes text to stdout, or to the
+        internal buffer if the console is buffered.
+        
+        Args:
+            text: str
+            
+        Returns: None
+        """
+        
+        if self.__buffer is None:
+            sys.stdout.write(text)
+            return
+        
+        self.__buffer.append(text)
+        self.__pending += len(text)
+        
+        if self.__pending >= self.__buffer_size:
+            self.flush()
+    
+    def __format_line(self, text: str, style: str, alignment: str, end: str) -> str:
+        """
+        Private method that styles and aligns a line of text.
+        
+        Args:
+            text: str,
+            style: str,
+            alignment: str,
+            end: str
+            
+        Returns: str
+        """
+        
+        prefix = self.__theme._resolved[style]
+        
+        # Left-aligned text needs no padding, so skip the width lookup
+        if alignment == LEFT:
+            return f"{prefix}{text}{end}"
+        
+        left, right = self.__align_text(_visible_len(text), alignment)
+        return f"{_SPACES[:left]}{prefix}{text}{_SPACES[:right]}{end}"
     
     @staticmethod
-    def __align_text(text: str, alignment: str) -> str | None:
+    def __align_text(length: int, alignment: str) -> tuple[int, int]:
         """
-        Private static method for text alignment
+        Private static method for text alignment. Returns the 
+        padding to place on the left and right of the text.
         
         Args:
-            text: str, 
+            length: int, 
             alignment: str
         
-        Returns: str 
+        Returns: tuple[int, int] 
         
         Raises: ValueError (if alignment is not valid)
         """
-        width = get_terminal_size().columns
         
-        if alignment == CENTER:
-            padding = (width - len(text)) // 2
-            return " " * padding + text + " " * (width - len(text) - padding)
+        try:
+            align = _ALIGNMENTS[alignment]
+        except KeyError:
+            raise ValueError(f"Invalid argument for function 'Console.__align_text': {alignment}") from None
         
-        elif alignment == RIGHT:
-            return (" " * (width - len(text)) + text).rstrip(" ")
-        
-        elif alignment == LEFT:
-            return (text + " " * (width - len(text))).lstrip(" ")
-        
-        else:
-            raise ValueError(f"Invalid argument for function 'Console.__align_text': {alignment}")
+        return align(length, _terminal_width())
     
 class ProgressBar(_BaseObject):
     """
-    Class for representing basic progress bars.
+    Class for representing basic progress bars. Can be used as a
+    context manager, which flushes stdout on exit:
+    
+        with ProgressBar(10) as bar:
+            bar.run()
     
     Args:
         values: int,
@@ -247,6 +462,8 @@ class ProgressBar(_BaseObject):
         delay: float = 1
     """
     
+    __slots__ = ("__values", "__theme", "__symbol", "__delay")
+    
     def __init__(self, values: int, *, theme: Theme = DEFAULT_THEME, symbol: str = "-", 
                  delay: float = 1) -> None:
         self.__values = values
@@ -286,39 +503,81 @@ class ProgressBar(_BaseObject):
     def delay(self, new: float) -> None:
         self.__delay = new
         
-    def run(self, style: str = "default", del_self: bool = False) -> None:
+    def __enter__(self) -> "ProgressBar":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        sys.stdout.flush()
+        
+    def run(self, style: str = "default", *, flush_every: int = 1, precise: bool = False) -> None:
         """
-        Run the progress bar.
+        Run the progress bar. Ticks are scheduled against absolute deadlines,
+        so the total duration stays close to values * delay. If precise is
+        True, the last millisecond before each deadline is spent spinning
+        instead of sleeping.
         
         Args:
             style: str = "default",
-            del_self: bool = False
+            flush_every: int = 1,
+            precise: bool = False
             
         Returns: None
+        
+        Raises: ValueError (if flush_every is less than 1)
         """
         
-        for _ in range(self.__values):
-            print(self.__theme.get_style(style) + self.__symbol, end=STOP, flush=True)
-            sleep(self.__delay)
+        if flush_every < 1:
+            raise ValueError("Argument flush_every must be at least 1")
+        
+        token = self.__theme._resolved[style] + self.__symbol + STOP
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        delay = self.__delay
+        
+        # Without a delay there is nothing to pace, so emit the whole bar at once
+        if delay <= 0:
+            write(token * self.__values)
+            flush()
+            return
+        
+        start = perf_counter()
+        
+        for tick in range(1, self.__values + 1):
+            write(token)
+            if not tick % flush_every:
+                flush()
+                
+            target = start + tick * delay
+            remaining = target - perf_counter()
             
-        if del_self:
-            del self
+            if precise:
+                if remaining > 0.002:
+                    sleep(remaining - 0.001)
+                while perf_counter() < target:
+                    pass
+            elif remaining > 0:
+                sleep(remaining)
+            
+        flush()
             
 class Table(_BaseObject):
     """
-    Table class for representing data.
+    Table class for representing data. Cells are stored column by column,
+    so adding or deleting a column does not touch every row.
     
     Args: columns: int = 0
     """
     
+    __slots__ = ("__columns", "__rows", "__cols")
+    
     def __init__(self, columns: int = 0) -> None:
         self.__columns = columns
         self.__rows = 0
-        self.__table = []
+        self.__cols = [[] for _ in range(columns)]
         
     def add_row(self, *objects: Any) -> None:
         """
-        Add a row to self.__table.
+        Add a row to self.__cols.
         
         Args:
             *objects: Any
@@ -326,33 +585,46 @@ class Table(_BaseObject):
         Returns: None
         """
         
-        objects = list(objects)
+        columns = self.__columns
+        row = objects
         
-        while len(objects) < self.__columns:
-            objects.append(None)
+        # Rows with the wrong number of cells are truncated or padded with None
+        if len(row) != columns:
+            row = objects[:columns]
+            if len(row) < columns:
+                row += (None,) * (columns - len(row))
             
-        while len(objects) > self.__columns:
-            objects.pop()
+        for column, obj in zip(self.__cols, row):
+            column.append(obj)
             
-        self.__table.append(objects)
         self.__rows += 1
         
     def del_row(self, index: int) -> None:
         """
-        Delete a row in self.__table.
+        Delete a row in self.__cols.
         
         Args:
             index: int
             
         Returns: None    
+        
+        Raises: IndexError (if index is out of range)
         """
         
-        del self.__table[index]
+        if index < 0:
+            index += self.__rows
+            
+        if not 0 <= index < self.__rows:
+            raise IndexError("Table row index out of range")
+        
+        for column in self.__cols:
+            del column[index]
+            
         self.__rows -= 1
         
     def del_column(self, index: int) -> None:
         """
-        Delete a column in self.__table.
+        Delete a column in self.__cols.
         
         Args:
             index: int
@@ -360,14 +632,12 @@ class Table(_BaseObject):
         Returns: None
         """
         
-        for row in self.__table:
-            del row[index]
-            
+        del self.__cols[index]
         self.__columns -= 1
         
     def add_column(self, placeholder: Any = "") -> None:
         """
-        Add a column in self.__table.
+        Add a column in self.__cols.
         
         Args:
             placeholder: Any = ""
@@ -375,14 +645,12 @@ class Table(_BaseObject):
         Returns: None
         """
         
-        for row in self.__table:
-            row.append(placeholder)
-        
+        self.__cols.append([placeholder] * self.__rows)
         self.__columns += 1
             
     def get_column(self, row_index: int, column_index: int) -> Any:
         """
-        Get the information in a column in self.__table.
+        Get the information in a column in self.__cols.
         
         Args:
             row_index: int,
@@ -391,11 +659,11 @@ class Table(_BaseObject):
         Returns: Any
         """
         
-        return self.__table[row_index][column_index]
+        return self.__cols[column_index][row_index]
     
     def set_column(self, info: Any, row_index: int, column_index: int) -> None:
         """
-        Set the information in a column in self.__table.
+        Set the information in a column in self.__cols.
         
         Args:
             row_index: int,
@@ -404,11 +672,11 @@ class Table(_BaseObject):
         Returns: None
         """
         
-        self.__table[row_index][column_index] = info
+        self.__cols[column_index][row_index] = info
         
     def get_row(self, index: int) -> list:
         """
-        Returns a row in self.__table.
+        Returns a copy of a row in self.__cols.
         
         Args:
             index: int
@@ -416,23 +684,21 @@ class Table(_BaseObject):
         Returns: list
         """
         
-        return self.__table[index]
+        return [column[index] for column in self.__cols]
     
     def get_table(self) -> str:
         """
-        Return a string representation of self.__table.
+        Return a string representation of self.__cols.
         
         Args: None
         
         Returns: str
         """
         
-        return_str = ""
+        rows = zip(*self.__cols) if self.__cols else repeat((), self.__rows)
         
-        for row in self.__table:
-            return_str += "| " + " | ".join(str(cell) if cell is not None else "" for cell in row) + " |" + "\n"
-            
-        return return_str
+        return "".join("| " + " | ".join("" if cell is None else str(cell) for cell in row) + " |\n" 
+                       for row in rows)
         
     @property
     def rows(self) -> int:
@@ -444,5 +710,5 @@ class Table(_BaseObject):
     
     @property
     def table(self) -> list[list]:
-        return self.__table
+        return [self.get_row(index) for index in range(self.__rows)]
     
\ No newline at end of file
@@ -1,7 +1,7 @@
 from unittest import TestCase, main
 from io import StringIO
 from unittest.mock import patch
-from py_style import Console, Theme
+from py_style import Console, Theme, RIGHT
 
 class TestConsole(TestCase):
 
@@ -13,6 +13,37 @@ class TestConsole(TestCase):
         self.console.print_title()
         self.assertIn("Test Console", mock_stdout.getvalue())
 
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_buffered_write_and_flush(self, mock_stdout):
+        console = Console("Buffered Console", print_title=False, buffered=True)
+        console.write("Buffered message")
+        self.assertEqual(mock_stdout.getvalue(), "")
+        console.flush()
+        self.assertIn("Buffered message", mock_stdout.getvalue())
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_write_alignment(self, mock_stdout):
+        self.console.write("Right", alignment=RIGHT)
+        self.assertTrue(mock_stdout.getvalue().lstrip(" ").startswith("\033[39mRight"))
+        self.assertRaises(ValueError, self.console.write, "Text", alignment="diagonal")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_write_left_has_no_padding(self, mock_stdout):
+        self.console.write("Left")
+        self.assertEqual(mock_stdout.getvalue(), "\033[39mLeft\033[0m\n")
+
+    @patch("py_style.models._TERM_WIDTH", 20)
+    @patch("py_style.models._WATCHING_RESIZE", True)
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_alignment_ignores_escape_codes(self, mock_stdout):
+        self.console.write("\033[1mRight", alignment=RIGHT)
+        self.assertTrue(mock_stdout.getvalue().startswith(" " * 15 + "\033[39m"))
+
+    @patch("sys.stdout")
+    def test_write_many(self, mock_stdout):
+        self.console.write_many(["First", "Second"], style="info")
+        mock_stdout.write.assert_called_once_with("\033[36mFirst\033[0m\n\033[36mSecond\033[0m\n")
+
     @patch("builtins.input", return_value="User input")
     def test_prompt(self, mock_input):
         result = self.console.prompt("Enter something:")
@@ -30,6 +61,11 @@ class TestConsole(TestCase):
         new_theme = Theme(info="cyan", warning="yellow", error="red", success="green")
         self.console.theme = new_theme
         self.assertEqual(self.console.theme, new_theme)
+
+    def test_theme_setter_updates_styles(self):
+        theme = Theme()
+        theme.success = "green"
+        self.assertEqual(theme.get_style("success"), "green")
     
 if __name__ == "__main__":
     main()
@@ -14,6 +14,32 @@ class TestProgressBar(TestCase):
         self.progress_bar.run()
         self.assertEqual(mock_stdout.getvalue().count("#"), 5)
 
+    @patch("sys.stdout")
+    def test_run_flush_every(self, mock_stdout):
+        self.progress_bar.delay = 0.001
+        self.progress_bar.run(flush_every=2)
+        self.assertEqual(mock_stdout.write.call_count, 5)
+        self.assertEqual(mock_stdout.flush.call_count, 3)
+        self.assertRaises(ValueError, self.progress_bar.run, flush_every=0)
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_run_precise(self, mock_stdout):
+        self.progress_bar.delay = 0.01
+        self.progress_bar.run(precise=True)
+        self.assertEqual(mock_stdout.getvalue().count("#"), 5)
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_context_manager(self, mock_stdout):
+        with ProgressBar(values=3, symbol="#", delay=0) as progress_bar:
+            progress_bar.run()
+        self.assertEqual(mock_stdout.getvalue().count("#"), 3)
+
+    @patch("sys.stdout")
+    def test_run_without_delay(self, mock_stdout):
+        self.progress_bar.delay = 0
+        self.progress_bar.run()
+        mock_stdout.write.assert_called_once_with("\033[39m#\033[0m" * 5)
+
     def test_values_setter(self):
         self.progress_bar.values = 10
         self.assertEqual(self.progress_bar.values, 10)
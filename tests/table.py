@@ -10,6 +10,12 @@ class TestTable(TestCase):
         self.table.add_row(1, 2, 3)
         self.assertEqual(self.table.get_row(0), [1, 2, 3])
 
+    def test_add_row_pads_and_truncates(self):
+        self.table.add_row(1)
+        self.table.add_row(1, 2, 3, 4)
+        self.assertEqual(self.table.get_row(0), [1, None, None])
+        self.assertEqual(self.table.get_row(1), [1, 2, 3])
+
     def test_add_column(self):
         self.table.add_row(1, 2, 3)
         self.table.add_column(placeholder=0)
@@ -20,11 +26,26 @@ class TestTable(TestCase):
         self.table.del_row(0)
         self.assertEqual(len(self.table.table), 0)
 
+    def test_del_row_out_of_range(self):
+        table = Table(0)
+        self.assertRaises(IndexError, table.del_row, 0)
+        table.add_row()
+        self.assertRaises(IndexError, table.del_row, 5)
+        table.del_row(-1)
+        self.assertEqual(table.rows, 0)
+
     def test_del_column(self):
         self.table.add_row(1, 2, 3)
         self.table.del_column(1)
         self.assertEqual(self.table.get_row(0), [1, 3])
 
+    def test_reshape_columns(self):
+        self.table.add_row(1, 2, 3)
+        self.table.add_row(4, 5, 6)
+        self.table.del_column(0)
+        self.table.add_column()
+        self.assertEqual(self.table.table, [[2, 3, ""], [5, 6, ""]])
+
     def test_get_set_column(self):
         self.table.add_row(1, 2, 3)
         self.assertEqual(self.table.get_column(0, 1), 2)
@@ -35,6 +56,12 @@ class TestTable(TestCase):
         self.table.add_row(1, 2, 3)
         table_str = self.table.get_table()
         self.assertIn("| 1 | 2 | 3 |", table_str)
+
+    def test_get_table_multiple_rows(self):
+        self.table.add_row(1, None, 3)
+        self.table.add_row("a", "b")
+        self.assertEqual(self.table.get_table(), "| 1 |  | 3 |\n| a | b |  |\n")
+        self.assertEqual(Table().get_table(), "")
     
 if __name__ == "__main__":
     main()